@@ -2,80 +2,216 @@
 # Quick Fit Memory Management System with GUI
 # This program uses the Tkinter library to simulate a memory allocation and deallocation system using the Quick Fit strategy.
 
+import bisect
+import re
+from collections import deque
+from enum import IntEnum
+
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import simpledialog
+
+
+class AllocStatus(IntEnum):
+    """
+    Result codes returned by QuickFit.allocate and QuickFit.deallocate.
+    """
+    OK = 0
+    NO_BLOCK = 1  # No suitable free block for the requested size
+    NO_PROCESS = 2  # No allocation exists for the process
+    ALREADY_ALLOCATED = 3  # The process already holds a block
 
 
 class QuickFit:
+    __slots__ = ('memory_blocks', 'allocated_processes', '_size_index', '_buckets', '_class_sizes',
+                 '_state_cache', '_state_dirty')
+
+    FALLBACK_CLASSES = 2  # Number of larger size classes to try when the exact one is empty
+
     def __init__(self, memory_blocks):
         """
         Initialize the memory management system.
-        :param memory_blocks: Dictionary of size-specific lists for memory blocks.
+        :param memory_blocks: Dictionary of size-specific lists (or other iterables) of memory blocks.
         """
-        self.memory_blocks = memory_blocks  # Dictionary of available memory blocks categorized by size
-        self.allocated_processes = {}  # Dictionary to track allocated processes
+        # Dictionary of available memory blocks categorized by size, each held in a deque
+        memory_blocks = {size: deque(blocks) for size, blocks in memory_blocks.items()}
+        self.memory_blocks = memory_blocks
+        self.allocated_processes = {}  # Maps process ID to a (block_name, size) tuple
+
+        # Segregated free lists: map each size class to a fixed bucket index
+        self._size_index = {size: idx for idx, size in enumerate(memory_blocks)}
+        self._buckets = list(memory_blocks.values())  # Same deques as memory_blocks, indexed by size class
+        self._class_sizes = sorted(memory_blocks)  # Size classes in ascending order, fixed at construction
+
+        # Cached output of get_memory_state, rebuilt only after a change
+        self._state_cache = ""
+        self._state_dirty = True
+
+    def _claim(self, process_id, size):
+        """
+        Take a free block for a process and record the allocation.
+        :param process_id: Identifier of the process.
+        :param size: Memory size required by the process.
+        :return: Tuple (block_name, served_size), or None if no suitable block is free
+        """
+        size_index = self._size_index
+        buckets = self._buckets
+
+        # First, try to find an exact match for the requested size
+        idx = size_index.get(size)
+        if idx is not None and buckets[idx]:
+            served_size = size
+        elif size <= 0:
+            # A non-positive request has no meaningful fallback
+            return None
+        else:
+            # Fall back to the next few larger size classes that still have a free block
+            class_sizes = self._class_sizes
+            start = bisect.bisect_left(class_sizes, size)
+            if idx is not None:
+                start += 1  # The exact size class is empty, skip it
+            for served_size in class_sizes[start:start + self.FALLBACK_CLASSES]:
+                idx = size_index[served_size]
+                if buckets[idx]:
+                    break
+            else:
+                # No suitable block is free
+                return None
+
+        allocated_block = buckets[idx].popleft()  # Remove the first available block of the served size
+        # Record the served size so the block goes back to the bucket it came from
+        rec = (allocated_block, served_size)
+        self.allocated_processes[process_id] = rec
+        self._state_dirty = True
+        return rec
+
+    def _release(self, process_id):
+        """
+        Return a process's block to the free lists and drop its allocation record.
+        :param process_id: Identifier of the process to deallocate.
+        :return: Tuple (block_name, block_size), or None if the process has no allocation
+        """
+        # Remove the process from allocated processes, retrieving its allocation details
+        rec = self.allocated_processes.pop(process_id, None)
+        if rec is None:
+            return None
+        block_name, block_size = rec
+
+        # Return block to the available memory pool. Blocks are only ever handed out
+        # from existing size classes, so the bucket is guaranteed to exist.
+        self._buckets[self._size_index[block_size]].append(block_name)
+        self._state_dirty = True
+        return rec
 
     def allocate(self, process_id, size):
         """
         Allocate memory to a process based on the requested size.
         :param process_id: Identifier of the process.
         :param size: Memory size required by the process.
-        :return: Tuple (success, message)
+        :return: Tuple (status, block_name, size); on success size is the served size, if the
+                 process already holds a block it is that block and its size, otherwise
+                 block_name is None and size is the requested size
         """
-        # First, try to find an exact match for the requested size
-        if size in self.memory_blocks and self.memory_blocks[size]:
-            allocated_block = self.memory_blocks[size].pop(0)  # Remove the first available block of the required size
-            self.allocated_processes[process_id] = {
-                'block': allocated_block,
-                'size': size
-            }
-            return True, f"Process {process_id} allocated to {allocated_block} ({size} KB)."
+        # A process holds at most one block; allocating again would lose the first one
+        rec = self.allocated_processes.get(process_id)
+        if rec is not None:
+            return (AllocStatus.ALREADY_ALLOCATED,) + rec
 
-        # If no exact match is found
-        return False, f"No exact block available for Process {process_id} requiring {size} KB."
+        rec = self._claim(process_id, size)
+        if rec is None:
+            return AllocStatus.NO_BLOCK, None, size
+        block_name, served_size = rec
+        return AllocStatus.OK, block_name, served_size
 
     def deallocate(self, process_id):
         """
         Deallocate a memory block for a specific process.
         :param process_id: Identifier of the process to deallocate.
-        :return: Tuple (success, message)
+        :return: Tuple (status, block_name, size); block_name and size are None on failure
         """
-        if process_id not in self.allocated_processes:
-            return False, f"No allocation found for Process {process_id}."
-
-        # Retrieve allocation details
-        allocation = self.allocated_processes[process_id]
-        block_size = allocation['size']
-        block_name = allocation['block']
-
-        # Return block to the available memory pool
-        if block_size in self.memory_blocks:
-            self.memory_blocks[block_size].append(block_name)
-        else:
-            # Create a new list for this block size if it doesn't exist
-            self.memory_blocks[block_size] = [block_name]
-
-        # Remove the process from allocated processes
-        del self.allocated_processes[process_id]
-        return True, f"Block {block_name} ({block_size} KB) deallocated."
+        released = self._release(process_id)
+        if released is None:
+            return AllocStatus.NO_PROCESS, None, None
+        block_name, block_size = released
+        return AllocStatus.OK, block_name, block_size
 
-    def get_memory_state(self):
+    def allocate_many(self, requests):
+        """
+        Allocate memory for a batch of processes without building any messages.
+        :param requests: Iterable of (process_id, size) pairs, processed in order.
+        :return: List of (status, process_id, block_name, size) tuples, matching allocate
+        """
+        claim = self._claim
+        allocated = self.allocated_processes
+        ok = AllocStatus.OK
+        no_block = AllocStatus.NO_BLOCK
+        already_allocated = AllocStatus.ALREADY_ALLOCATED
+        results = []
+        append = results.append
+        for process_id, size in requests:
+            rec = allocated.get(process_id)
+            if rec is not None:
+                append((already_allocated, process_id) + rec)
+                continue
+            rec = claim(process_id, size)
+            if rec is None:
+                append((no_block, process_id, None, size))
+            else:
+                append((ok, process_id) + rec)
+        return results
+
+    def deallocate_many(self, process_ids):
+        """
+        Deallocate a batch of processes without building any messages.
+        :param process_ids: Iterable of process identifiers, processed in order.
+        :return: List of (status, process_id, block_name, size) tuples, matching deallocate:
+                 block_name and size are None on failure
+        """
+        release = self._release
+        ok = AllocStatus.OK
+        no_process = AllocStatus.NO_PROCESS
+        results = []
+        append = results.append
+        for process_id in process_ids:
+            released = release(process_id)
+            if released is None:
+                append((no_process, process_id, None, None))
+            else:
+                append((ok, process_id) + released)
+        return results
+
+    def get_memory_state(self, force=False):
         """
         Get the current state of memory blocks.
+        :param force: Rebuild the state even if no allocation has changed it, e.g. after
+                      memory_blocks was modified directly.
         :return: Formatted string of memory state
         """
-        state = "Available Memory Blocks:\n"
-        for size, blocks in self.memory_blocks.items():
-            state += f"{size} KB Blocks: {blocks}\n"
+        if not self._state_dirty and not force:
+            return self._state_cache
+
+        # Collect the lines in a list and join once, rather than growing a string with +=
+        parts = ["Available Memory Blocks:"]
+        size_index = self._size_index
+        buckets = self._buckets
+        parts.extend(f"{size} KB Blocks: {list(buckets[size_index[size]])}" for size in self._class_sizes)
 
-        state += "\nAllocated Processes:\n"
-        for process, details in self.allocated_processes.items():
-            state += f"Process {process}: {details['block']} ({details['size']} KB)\n"
+        parts.append("")
+        parts.append("Allocated Processes:")
+        parts.extend(f"Process {process}: {block} ({size} KB)"
+                     for process, (block, size) in self.allocated_processes.items())
 
-        return state
+        parts.append("")  # Keep the trailing newline
+        self._state_cache = "\n".join(parts)
+        self._state_dirty = False
+        return self._state_cache
 
 
 class QuickFitGUI:
+    __slots__ = ('master', 'quick_fit', '_displayed_state', '_refresh_pending', 'process_id_entry', 'size_entry',
+                 'state_text', 'status_label')
+
+    _INT_RE = re.compile(r'^\s*\d+\s*$')  # Memory size must be a non-negative whole number
+
     def __init__(self, master):
         """
         Initialize the Tkinter GUI for Quick Fit Memory Management.
@@ -92,6 +228,8 @@ class QuickFitGUI:
             200: ["Block5"]
         }
         self.quick_fit = QuickFit(initial_blocks)
+        self._displayed_state = None  # State string currently shown in the text widget
+        self._refresh_pending = False  # True while a refresh is queued with after_idle
 
         # Create and configure the GUI components
         self.create_widgets()
@@ -133,8 +271,13 @@ class QuickFitGUI:
         self.state_text = tk.Text(state_frame, height=10, width=70, wrap=tk.WORD)
         self.state_text.pack(padx=5, pady=5)
 
+        # Status Line for the outcome of the last operation
+        self.status_label = tk.Label(self.master, text="", anchor="w")
+        self.status_label.pack(padx=10, fill="x")
+
         # Refresh State Button
-        refresh_btn = tk.Button(self.master, text="Refresh Memory State", command=self.refresh_state)
+        refresh_btn = tk.Button(self.master, text="Refresh Memory State",
+                                command=lambda: self.refresh_state(force=True))
         refresh_btn.pack(pady=5)
 
         # Display the initial memory state
@@ -144,65 +287,114 @@ class QuickFitGUI:
         """
         Handle memory allocation based on user input from the GUI.
         """
-        process_id = self.process_id_entry.get()
-        size_str = self.size_entry.get()
+        # Bind repeatedly used lookups to locals
+        END = tk.END
+        set_status = self._set_status
+        process_id_entry = self.process_id_entry
+        size_entry = self.size_entry
+
+        process_id = process_id_entry.get().strip()
+        size_str = size_entry.get()
 
         # Validate input fields
         if not process_id or not size_str:
-            messagebox.showerror("Error", "Please enter both Process ID and Memory Size")
+            set_status("Please enter both Process ID and Memory Size", "red")
             return
 
-        try:
-            size = int(size_str)  # Convert memory size to integer
-        except ValueError:
-            messagebox.showerror("Error", "Memory Size must be a number")
+        # Reject malformed input up front instead of catching ValueError from int()
+        if not self._INT_RE.match(size_str):
+            set_status("Memory Size must be a number", "red")
+            return
+        size = int(size_str)  # Convert memory size to integer
+        if size <= 0:
+            set_status("Memory Size must be greater than zero", "red")
             return
 
         # Attempt to allocate memory
-        success, message = self.quick_fit.allocate(process_id, size)
+        status, block_name, block_size = self.quick_fit.allocate(process_id, size)
 
-        if success:
-            messagebox.showinfo("Allocation Success", message)
+        if status is AllocStatus.OK:
+            set_status(f"Process {process_id} allocated to {block_name} ({block_size} KB).", "dark green")
+        elif status is AllocStatus.ALREADY_ALLOCATED:
+            set_status(f"Process {process_id} already holds {block_name} ({block_size} KB).", "dark orange")
         else:
-            messagebox.showwarning("Allocation Failed", message)
+            set_status(f"No block available for Process {process_id} requiring {block_size} KB.", "dark orange")
 
         # Clear input fields
-        self.process_id_entry.delete(0, tk.END)
-        self.size_entry.delete(0, tk.END)
+        process_id_entry.delete(0, END)
+        size_entry.delete(0, END)
 
-        # Refresh memory state display
-        self.refresh_state()
+        # Refresh memory state display once the event loop is idle
+        self._schedule_refresh()
 
     def deallocate_memory(self):
         """
         Handle memory deallocation via a dialog.
         """
         process_id = simpledialog.askstring("Deallocate", "Enter Process ID to Deallocate:")
+        if process_id is None:
+            return
 
+        # Strip the same way allocate_memory does so the IDs match
+        process_id = process_id.strip()
         if not process_id:
             return
 
         # Attempt to deallocate memory
-        success, message = self.quick_fit.deallocate(process_id)
+        status, block_name, block_size = self.quick_fit.deallocate(process_id)
 
-        if success:
-            messagebox.showinfo("Deallocation Success", message)
+        if status is AllocStatus.OK:
+            self._set_status(f"Block {block_name} ({block_size} KB) deallocated.", "dark green")
         else:
-            messagebox.showwarning("Deallocation Failed", message)
+            self._set_status(f"No allocation found for Process {process_id}.", "dark orange")
 
-        # Refresh memory state display
+        # Refresh memory state display once the event loop is idle
+        self._schedule_refresh()
+
+    def _set_status(self, message, color):
+        """
+        Show the outcome of the last operation in the status line.
+        :param message: Text to display.
+        :param color: Foreground color of the text.
+        """
+        self.status_label.config(text=message, fg=color)
+
+    def _schedule_refresh(self):
+        """
+        Queue a refresh of the memory state display for the next idle cycle.
+        Repeated calls before it runs are coalesced into a single refresh.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.master.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        """
+        Run a refresh queued by _schedule_refresh.
+        """
+        self._refresh_pending = False
         self.refresh_state()
 
-    def refresh_state(self):
+    def refresh_state(self, force=False):
         """
         Refresh the memory state display in the GUI.
+        :param force: Rebuild the memory state and redraw the text widget unconditionally.
         """
+        # get_memory_state returns the same cached string until memory changes,
+        # so an identical object means the display is already up to date
+        state = self.quick_fit.get_memory_state(force)
+        if state is self._displayed_state and not force:
+            return
+
+        END = tk.END
+        state_text = self.state_text
+
         # Clear the current text display
-        self.state_text.delete(1.0, tk.END)
+        state_text.delete(1.0, END)
 
-        # Fetch and display the current memory state
-        state = self.quick_fit.get_memory_state()
-        self.state_text.insert(tk.END, state)
+        # Display the current memory state
+        state_text.insert(END, state)
+        self._displayed_state = state
 
 
 def main():
@@ -0,0 +1,129 @@
+import unittest
+
+from MIniProject import AllocStatus, QuickFit
+
+
+def make_quick_fit():
+    """
+    Build an allocator with the same memory layout as the GUI.
+    """
+    return QuickFit({
+        50: ["Block1", "Block2"],
+        100: ["Block3", "Block4"],
+        200: ["Block5"]
+    })
+
+
+class QuickFitTest(unittest.TestCase):
+    def test_accepts_plain_lists(self):
+        blocks = {50: ["Block1"]}
+        quick_fit = QuickFit(blocks)
+        status, block_name, size = quick_fit.allocate("P1", 50)
+        self.assertIs(status, AllocStatus.OK)
+        self.assertEqual((block_name, size), ("Block1", 50))
+        # The caller's lists are copied, not consumed
+        self.assertEqual(blocks, {50: ["Block1"]})
+
+    def test_memory_state_is_cached_until_changed(self):
+        quick_fit = make_quick_fit()
+        state = quick_fit.get_memory_state()
+        self.assertIs(quick_fit.get_memory_state(), state)
+
+        quick_fit.allocate("P1", 50)
+        self.assertIn("Process P1: Block1 (50 KB)", quick_fit.get_memory_state())
+
+    def test_forced_memory_state_sees_direct_changes(self):
+        quick_fit = make_quick_fit()
+        quick_fit.get_memory_state()
+        quick_fit.memory_blocks[50].append("Block6")
+        self.assertIn("Block6", quick_fit.get_memory_state(force=True))
+
+    def test_exact_hit(self):
+        quick_fit = make_quick_fit()
+        self.assertEqual(quick_fit.allocate("P1", 100), (AllocStatus.OK, "Block3", 100))
+        self.assertEqual(list(quick_fit.memory_blocks[100]), ["Block4"])
+
+    def test_falls_back_to_next_class(self):
+        quick_fit = make_quick_fit()
+        quick_fit.allocate("P1", 50)
+        quick_fit.allocate("P2", 50)
+        self.assertEqual(quick_fit.allocate("P3", 50), (AllocStatus.OK, "Block3", 100))
+
+    def test_fallback_is_bounded(self):
+        quick_fit = QuickFit({10: [], 20: [], 30: [], 40: ["Block1"]})
+        # 40 KB is free but lies three classes above 10 KB, past FALLBACK_CLASSES
+        self.assertEqual(quick_fit.allocate("P1", 10), (AllocStatus.NO_BLOCK, None, 10))
+        self.assertEqual(list(quick_fit.memory_blocks[40]), ["Block1"])
+
+    def test_non_class_size_uses_next_larger_class(self):
+        quick_fit = make_quick_fit()
+        self.assertEqual(quick_fit.allocate("P1", 75), (AllocStatus.OK, "Block3", 100))
+        self.assertEqual(quick_fit.allocate("P2", 300), (AllocStatus.NO_BLOCK, None, 300))
+
+    def test_non_positive_size_is_rejected(self):
+        quick_fit = make_quick_fit()
+        self.assertEqual(quick_fit.allocate("P1", 0), (AllocStatus.NO_BLOCK, None, 0))
+        self.assertEqual(quick_fit.allocate("P2", -5), (AllocStatus.NO_BLOCK, None, -5))
+
+    def test_served_block_returns_to_served_bucket(self):
+        quick_fit = make_quick_fit()
+        quick_fit.allocate("P1", 50)
+        quick_fit.allocate("P2", 50)
+        quick_fit.allocate("P3", 50)
+        self.assertEqual(quick_fit.deallocate("P3"), (AllocStatus.OK, "Block3", 100))
+        self.assertEqual(list(quick_fit.memory_blocks[50]), [])
+        self.assertEqual(list(quick_fit.memory_blocks[100]), ["Block4", "Block3"])
+
+    def test_deallocate_unknown_process(self):
+        quick_fit = make_quick_fit()
+        self.assertEqual(quick_fit.deallocate("P1"), (AllocStatus.NO_PROCESS, None, None))
+
+    def test_freed_allocation_does_not_disturb_others(self):
+        quick_fit = make_quick_fit()
+        quick_fit.allocate("P1", 50)
+        quick_fit.allocate("P2", 100)
+        quick_fit.deallocate("P1")
+        # Freeing P1 and allocating P3 must leave P2 unaffected
+        quick_fit.allocate("P3", 200)
+        self.assertEqual(quick_fit.deallocate("P2"), (AllocStatus.OK, "Block3", 100))
+        self.assertEqual(quick_fit.deallocate("P3"), (AllocStatus.OK, "Block5", 200))
+        self.assertEqual(quick_fit.deallocate("P1"), (AllocStatus.NO_PROCESS, None, None))
+        self.assertEqual(list(quick_fit.memory_blocks[50]), ["Block2", "Block1"])
+
+    def test_batch_results_match_single_calls(self):
+        quick_fit = make_quick_fit()
+        self.assertEqual(quick_fit.allocate_many([("P1", 50), ("P2", 50), ("P3", 50), ("P4", 300)]), [
+            (AllocStatus.OK, "P1", "Block1", 50),
+            (AllocStatus.OK, "P2", "Block2", 50),
+            (AllocStatus.OK, "P3", "Block3", 100),
+            (AllocStatus.NO_BLOCK, "P4", None, 300),
+        ])
+        self.assertEqual(quick_fit.deallocate_many(["P3", "P4"]), [
+            (AllocStatus.OK, "P3", "Block3", 100),
+            (AllocStatus.NO_PROCESS, "P4", None, None),
+        ])
+
+    def test_allocation_records_are_not_reused(self):
+        quick_fit = make_quick_fit()
+        quick_fit.allocate("P1", 50)
+        record = quick_fit.allocated_processes["P1"]
+        quick_fit.deallocate("P1")
+        quick_fit.allocate("P2", 100)
+        self.assertEqual(record, ("Block1", 50))
+        self.assertEqual(quick_fit.allocated_processes, {"P2": ("Block3", 100)})
+
+    def test_allocating_an_allocated_process_is_rejected(self):
+        quick_fit = make_quick_fit()
+        quick_fit.allocate("P1", 50)
+        self.assertEqual(quick_fit.allocate("P1", 50), (AllocStatus.ALREADY_ALLOCATED, "Block1", 50))
+        self.assertEqual(quick_fit.allocate_many([("P1", 100)]),
+                         [(AllocStatus.ALREADY_ALLOCATED, "P1", "Block1", 50)])
+        # Block1 stays with P1 and comes back on deallocation
+        self.assertEqual(list(quick_fit.memory_blocks[50]), ["Block2"])
+        self.assertEqual(list(quick_fit.memory_blocks[100]), ["Block3", "Block4"])
+        self.assertEqual(quick_fit.deallocate("P1"), (AllocStatus.OK, "Block1", 50))
+        self.assertEqual(list(quick_fit.memory_blocks[50]), ["Block2", "Block1"])
+
+
+if __name__ == "__main__":
+    unittest.main()